@@ -3,47 +3,132 @@ import yfinance as yf
 import requests
 import pandas as pd
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 from dotenv import load_dotenv
 import os
+import time
 from datetime import datetime, timedelta
-import json
+import orjson
 import zipfile
+import shutil
+import tempfile
 import xml.etree.ElementTree as ET
-from io import BytesIO
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Load environment variables
 load_dotenv()
 DART_API_KEY = os.getenv('DART_API_KEY')
 
-# Cache decorators for API calls
-@st.cache_data(ttl=3600)
-def get_dart_corp_codes():
-    """DART에서 한국 주식 회사 코드 조회"""
+# DART/KRX 호출에 공통으로 사용하는 HTTP 세션 (연결 재사용)
+SESSION = requests.Session()
+SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (dividend-dashboard)',
+    'Accept': 'application/json'
+})
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+# (연결, 읽기) 타임아웃 초 - 응답이 멈춘 연결이 스크립트/작업 스레드를 붙잡지 않도록
+HTTP_TIMEOUT = (5, 30)
+DOWNLOAD_TIMEOUT = (5, 120)  # CORPCODE.zip 스트리밍 다운로드용
+
+# 조회 기간 / 주가 표 컬럼 형식 / DART 보고서 종류 표시명
+PERIOD_LABELS = {
+    '1mo': '1개월', '3mo': '3개월', '6mo': '6개월',
+    '1y': '1년', '2y': '2년', '5y': '5년'
+}
+HISTORY_COLUMN_CONFIG = {
+    'Open': st.column_config.NumberColumn(format="%.2f"),
+    'High': st.column_config.NumberColumn(format="%.2f"),
+    'Low': st.column_config.NumberColumn(format="%.2f"),
+    'Close': st.column_config.NumberColumn(format="%.2f"),
+    'Volume': st.column_config.NumberColumn(format="%d")
+}
+REPORT_TYPES = {
+    "11011": "사업보고서",
+    "11012": "반기보고서",
+    "11013": "1분기보고서",
+    "11014": "3분기보고서"
+}
+
+# 느린 목록 조회 결과를 보관하는 디스크 캐시 (Streamlit 재시작에도 유지)
+DISK_CACHE_DIR = Path.home() / ".cache" / "dividend"
+DISK_CACHE_MAX_AGE = 86400
+
+def read_disk_cache(name):
+    """디스크 캐시(parquet) 조회, 없거나 오래되면 None"""
+    path = DISK_CACHE_DIR / f"{name}.parquet"
+    try:
+        if path.stat().st_mtime > time.time() - DISK_CACHE_MAX_AGE:
+            return pd.read_parquet(path)
+    except Exception:
+        pass
+    return None
+
+def write_disk_cache(name, df):
+    """디스크 캐시(parquet) 저장, 실패해도 무시"""
+    try:
+        DISK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(DISK_CACHE_DIR / f"{name}.parquet", compression='zstd', index=False)
+    except Exception:
+        pass
+
+def download_dart_corp_codes():
+    """DART 회사 코드 파일(CORPCODE.zip) 다운로드 및 파싱"""
     url = "https://opendart.fss.or.kr/api/corpCode.xml"
     params = {'crtfc_key': DART_API_KEY}
     
-    try:
-        response = requests.get(url, params=params)
+    # 응답을 메모리에 통째로 올리지 않고 임시 파일로 흘려받음
+    # (zip 목차가 파일 끝에 있어 ZipFile은 탐색 가능한 파일이 필요)
+    with SESSION.get(url, params=params, stream=True, timeout=DOWNLOAD_TIMEOUT) as response, \
+            tempfile.SpooledTemporaryFile(max_size=1024 * 1024) as buffer:
         response.raise_for_status()
+        response.raw.decode_content = True
+        shutil.copyfileobj(response.raw, buffer)
+        buffer.seek(0)
         
-        with zipfile.ZipFile(BytesIO(response.content)) as z:
+        with zipfile.ZipFile(buffer) as z:
             with z.open('CORPCODE.xml') as xml_file:
-                tree = ET.parse(xml_file)
-                root = tree.getroot()
-                
-                data = []
-                for company in root.findall('.//list'):
-                    corp_code = company.findtext('corp_code')
-                    corp_name = company.findtext('corp_name')
-                    stock_code = company.findtext('stock_code')
+                # 전체 트리를 만들지 않고 <list> 단위로 스트리밍 파싱
+                corp_codes, corp_names, stock_codes = [], [], []
+                for _, elem in ET.iterparse(xml_file, events=('end',)):
+                    if elem.tag != 'list':
+                        continue
+                    stock_code = elem.findtext('stock_code')
                     if stock_code and stock_code.strip():
-                        data.append({
-                            'corp_code': corp_code,
-                            'corp_name': corp_name,
-                            'stock_code': stock_code
-                        })
-                
-                return pd.DataFrame(data)
+                        corp_codes.append(elem.findtext('corp_code'))
+                        corp_names.append(elem.findtext('corp_name'))
+                        stock_codes.append(stock_code)
+                    elem.clear()
+    
+    # 컬럼 리스트를 Arrow 문자열 배열로 바로 변환 (object 컬럼을 거치지 않음)
+    return pd.DataFrame({
+        'corp_code': pd.array(corp_codes, dtype='string[pyarrow]'),
+        'corp_name': pd.array(corp_names, dtype='string[pyarrow]'),
+        'stock_code': pd.array(stock_codes, dtype='string[pyarrow]')
+    }, copy=False)
+
+# Cache decorators for API calls
+@st.cache_data(ttl=3600)
+def get_dart_corp_codes():
+    """DART에서 한국 주식 회사 코드 조회"""
+    try:
+        df = read_disk_cache("corpcodes")
+        if df is None:
+            df = download_dart_corp_codes()
+            write_disk_cache("corpcodes", df)
+        
+        # 캐시 메모리 절감 및 Arrow 문자열 커널 사용 (디스크 캐시에서 읽은 경우 대비)
+        df = df.astype('string[pyarrow]', copy=False)
+        # 종목코드 조회를 해시 탐색으로 처리하기 위해 인덱스로 지정 (중복 제거)
+        return df.drop_duplicates('stock_code').set_index('stock_code', drop=False)
     except Exception as e:
         st.error(f"회사 코드 데이터 조회 실패: {str(e)}")
         return pd.DataFrame()
@@ -52,31 +137,34 @@ def get_dart_corp_codes():
 def get_krx_etf_list():
     """한국거래소 ETF 목록 조회"""
     try:
+        df = read_disk_cache("etflist")
+        if df is not None:
+            return df
+        
         url = "http://data.krx.co.kr/comm/bldAttendant/getJsonData.cmd"
-        headers = {
-            'Content-Type': 'application/x-www-form-urlencoded',
-            'Accept': 'application/json'
-        }
         params = {
             'bld': 'dbms/MDC/STAT/standard/MDCSTAT04601',
             'locale': 'ko_KR',
         }
         
-        response = requests.post(url, headers=headers, data=params)
+        response = SESSION.post(url, data=params, timeout=HTTP_TIMEOUT)
         response.raise_for_status()
         
-        data = response.json()
+        data = orjson.loads(response.content)
         df = pd.DataFrame(data['output'])
         df = df[['ISU_SRT_CD', 'ISU_NM', 'ISU_CD']]
         df.columns = ['종목코드', '종목명', '표준코드']
+        write_disk_cache("etflist", df)
         return df
         
     except Exception as e:
         st.error(f"ETF 목록 조회 실패: {str(e)}")
         return pd.DataFrame()
 
-def get_korean_stock_dividend(corp_code, year, reprt_code="11011"):
-    """한국 주식 배당 정보 조회"""
+# st.cache_data는 반환값을 그대로 저장하므로, 캐시 대상 fetch_* 함수는 실패 시 예외를 던지고
+# 오류 메시지 변환은 캐시되지 않는 get_* 함수에서 처리 (일시적 오류가 캐시되지 않도록)
+def fetch_korean_stock_dividend(corp_code, year, reprt_code="11011"):
+    """한국 주식 배당 정보 조회 (실패 시 예외 발생)"""
     url = "https://opendart.fss.or.kr/api/alotMatter.json"
     params = {
         'crtfc_key': DART_API_KEY,
@@ -85,97 +173,181 @@ def get_korean_stock_dividend(corp_code, year, reprt_code="11011"):
         'reprt_code': reprt_code
     }
     
-    try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()
+    response = SESSION.get(url, params=params, timeout=HTTP_TIMEOUT)
+    response.raise_for_status()
+    
+    data = orjson.loads(response.content)
+    if data.get('status') == "013":  # 조회된 데이터 없음
+        return pd.DataFrame(), "데이터가 없습니다."
+    if data.get('status') != "000":
+        raise RuntimeError(f"DART API 오류: {data.get('message')}")
         
-        data = response.json()
-        if data.get('status') != "000":
-            return None, f"DART API 오류: {data.get('message')}"
-            
-        if not data.get('list'):
-            return pd.DataFrame(), "데이터가 없습니다."
-            
-        df = pd.DataFrame(data['list'])
-        column_mapping = {
-            'thstrm': '당기',
-            'frmtrm': '전기',
-            'lwfr': '전전기',
-            'stock_knd': '주식 종류',
-            'thstrm_dd': '당기 배당일',
-            'frmtrm_dd': '전기 배당일',
-            'lwfr_dd': '전전기 배당일'
-        }
-        df = df.rename(columns=column_mapping)
-        return df, None
+    if not data.get('list'):
+        return pd.DataFrame(), "데이터가 없습니다."
         
+    df = pd.DataFrame(data['list'])
+    column_mapping = {
+        'thstrm': '당기',
+        'frmtrm': '전기',
+        'lwfr': '전전기',
+        'stock_knd': '주식 종류',
+        'thstrm_dd': '당기 배당일',
+        'frmtrm_dd': '전기 배당일',
+        'lwfr_dd': '전전기 배당일'
+    }
+    df = df.rename(columns=column_mapping)
+    return df, None
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_korean_stock_dividend_all(corp_code, year):
+    """한국 주식 배당 정보 조회 (보고서 종류별 동시 조회, 실패 시 예외 발생)"""
+    # 작업 스레드에는 ScriptRunContext가 없어 st.cache_data가 동작하지 않으므로
+    # 캐시는 스크립트 스레드에서 호출되는 이 함수에 적용
+    codes = tuple(REPORT_TYPES)
+    results = {}
+    with ThreadPoolExecutor(max_workers=len(codes)) as ex:
+        futures = {ex.submit(fetch_korean_stock_dividend, corp_code, year, rc): rc for rc in codes}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return {rc: results[rc] for rc in codes}
+
+def get_korean_stock_dividend_all(corp_code, year):
+    """한국 주식 배당 정보 조회 (보고서 종류별)"""
+    try:
+        return fetch_korean_stock_dividend_all(corp_code, year), None
     except Exception as e:
         return None, f"배당 정보 조회 실패: {str(e)}"
 
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_korean_etf_distribution(code, start_date, end_date):
+    """한국 ETF 분배금 정보 조회 (실패 시 예외 발생)"""
+    url = "http://data.krx.co.kr/comm/bldAttendant/getJsonData.cmd"
+    params = {
+        'bld': 'dbms/MDC/STAT/standard/MDCSTAT04701',
+        'searchType': '1',
+        'isuCd': code,
+        'strtDd': start_date.strftime('%Y%m%d'),
+        'endDd': end_date.strftime('%Y%m%d')
+    }
+    
+    response = SESSION.post(url, data=params, timeout=HTTP_TIMEOUT)
+    response.raise_for_status()
+    
+    data = orjson.loads(response.content)
+    if not data.get('output'):
+        return pd.DataFrame(), "해당 기간의 분배금 정보가 없습니다."
+        
+    df = pd.DataFrame(data['output'])
+    column_mapping = {
+        'ETF_NM': 'ETF명',
+        'BAS_DD': '기준일',
+        'PAY_DD': '지급일',
+        'CAS_DSB': '현금분배금',
+        'STK_DSB': '주식분배금',
+        'TOT_DSB': '총분배금'
+    }
+    df = df.rename(columns=column_mapping)
+    
+    # 금액 컬럼 숫자로 변환 (한 번에 처리, 가능한 작은 정수형으로)
+    cols = ['현금분배금', '주식분배금', '총분배금']
+    df[cols] = df[cols].replace({',': ''}, regex=True).apply(
+        pd.to_numeric, errors='coerce', downcast='integer'
+    )
+        
+    return df, None
+
 def get_korean_etf_distribution(code, start_date, end_date):
     """한국 ETF 분배금 정보 조회"""
     try:
-        url = "http://data.krx.co.kr/comm/bldAttendant/getJsonData.cmd"
-        headers = {
-            'Content-Type': 'application/x-www-form-urlencoded',
-            'Accept': 'application/json'
-        }
-        params = {
-            'bld': 'dbms/MDC/STAT/standard/MDCSTAT04701',
-            'searchType': '1',
-            'isuCd': code,
-            'strtDd': start_date.strftime('%Y%m%d'),
-            'endDd': end_date.strftime('%Y%m%d')
-        }
-        
-        response = requests.post(url, headers=headers, data=params)
-        response.raise_for_status()
-        
-        data = response.json()
-        if not data.get('output'):
-            return pd.DataFrame(), "해당 기간의 분배금 정보가 없습니다."
-            
-        df = pd.DataFrame(data['output'])
-        column_mapping = {
-            'ETF_NM': 'ETF명',
-            'BAS_DD': '기준일',
-            'PAY_DD': '지급일',
-            'CAS_DSB': '현금분배금',
-            'STK_DSB': '주식분배금',
-            'TOT_DSB': '총분배금'
-        }
-        df = df.rename(columns=column_mapping)
-        
-        # 금액 컬럼 숫자로 변환
-        for col in ['현금분배금', '주식분배금', '총분배금']:
-            df[col] = pd.to_numeric(df[col].str.replace(',', ''), errors='coerce')
-            
-        return df, None
-        
+        return fetch_korean_etf_distribution(code, start_date, end_date)
     except Exception as e:
         return None, f"분배금 정보 조회 실패: {str(e)}"
 
+def dividends_from_history(history):
+    """주가 데이터에 포함된 배당(분배금) 내역 추출"""
+    if 'Dividends' not in history:
+        return pd.Series(dtype=float, name='Dividends')
+    return history.loc[history['Dividends'] != 0, 'Dividends']
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_us_history(ticker, period="1y"):
+    """미국 주식/ETF 주가 및 배당(분배금) 조회 (실패 시 예외 발생)"""
+    # 주가 한 번만 요청하고 배당은 주가 데이터에서 추출
+    history = yf.Ticker(ticker).history(period=period)
+    return history, dividends_from_history(history)
+
 def get_us_stock_data(ticker, period="1y"):
     """미국 주식 데이터 조회"""
     try:
-        stock = yf.Ticker(ticker)
-        history = stock.history(period=period)
-        info = stock.info
-        dividends = stock.dividends
-        return history, info, dividends, None
+        history, dividends = fetch_us_history(ticker, period)
+        return history, dividends, None
+    except Exception as e:
+        return None, None, f"데이터 조회 실패: {str(e)}"
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_us_stocks_history(tickers, period="1y"):
+    """미국 주식 여러 종목 주가 일괄 조회 (실패 시 예외 발생)"""
+    # 주가는 다중 종목 엔드포인트로 한 번에 조회
+    data = yf.download(
+        tickers, period=period, group_by='ticker', threads=True, progress=False
+    )
+    downloaded = set(data.columns.get_level_values(0))
+    return {
+        t: data[t].dropna(how='all') for t in tickers if t in downloaded
+    }
+
+def get_us_stocks_data(tickers, period="1y"):
+    """미국 주식 여러 종목 데이터 일괄 조회"""
+    try:
+        return fetch_us_stocks_history(tickers, period), None
     except Exception as e:
-        return None, None, None, f"데이터 조회 실패: {str(e)}"
+        return None, f"데이터 조회 실패: {str(e)}"
 
 def get_us_etf_data(ticker, period="1y"):
     """미국 ETF 데이터 조회"""
     try:
-        etf = yf.Ticker(ticker)
-        history = etf.history(period=period)
-        info = etf.info
-        distributions = etf.dividends  # ETF의 경우 배당금이 분배금을 포함
-        return history, info, distributions, None
+        history, distributions = fetch_us_history(ticker, period)  # ETF의 경우 배당금이 분배금을 포함
+        return history, distributions, None
     except Exception as e:
-        return None, None, None, f"데이터 조회 실패: {str(e)}"
+        return None, None, f"데이터 조회 실패: {str(e)}"
+
+def maybe_resample(df, period):
+    """장기 조회 시 차트용 OHLC 데이터를 주/격주 단위로 축소"""
+    rule = {'2y': 'W', '5y': '2W'}.get(period)
+    # 데이터가 없는 종목은 yfinance가 날짜 인덱스가 아닌 빈 DataFrame을 반환
+    if rule is None or df.empty or not isinstance(df.index, pd.DatetimeIndex):
+        return df
+    return df.resample(rule).agg({
+        'Open': 'first',
+        'High': 'max',
+        'Low': 'min',
+        'Close': 'last'
+    }).dropna()
+
+def plot_candlestick(history, period, title, trace_name):
+    """캔들차트 렌더링"""
+    ohlc = maybe_resample(history, period)
+    fig = go.Figure(data=[
+        go.Candlestick(
+            x=ohlc.index,
+            open=ohlc['Open'],
+            high=ohlc['High'],
+            low=ohlc['Low'],
+            close=ohlc['Close'],
+            name=trace_name
+        )
+    ])
+    fig.update_layout(
+        title=title,
+        yaxis_title="주가",
+        xaxis_title="날짜",
+        template="plotly_white"
+    )
+    st.plotly_chart(fig)
+
+def show_history(history):
+    """주가 데이터 표 렌더링"""
+    st.dataframe(history, use_container_width=True, column_config=HISTORY_COLUMN_CONFIG)
 
 def main():
     st.set_page_config(
@@ -205,6 +377,12 @@ def main():
         else:
             render_us_etf_section()
 
+def submitted_query(key, submitted, query):
+    """폼 제출 시 조회 조건을 저장하고 마지막으로 제출된 조건 반환"""
+    if submitted:
+        st.session_state[key] = query
+    return st.session_state.get(key)
+
 def render_korean_stock_section():
     st.sidebar.subheader("한국 주식 검색")
     corp_codes_df = get_dart_corp_codes()
@@ -214,103 +392,137 @@ def render_korean_stock_section():
         ["회사명으로 검색", "종목코드로 검색"]
     )
     
+    # 입력값은 '조회' 버튼을 누를 때 한 번에 반영
+    with st.sidebar.form("query_form"):
+        if search_method == "회사명으로 검색":
+            keyword = st.text_input("회사명 입력", placeholder="예: 삼성전자")
+        else:
+            keyword = st.text_input("종목코드 입력", placeholder="예: 005930")
+        year = st.slider("배당 정보 사업연도 선택", 2015, 2024, 2023)
+        submitted = st.form_submit_button("조회")
+    
+    query = submitted_query(f"kr_stock_query:{search_method}", submitted, (keyword, year))
+    if not query or not query[0]:
+        return
+    keyword, year = query
+    
     if search_method == "회사명으로 검색":
-        company_name = st.sidebar.text_input("회사명 입력", placeholder="예: 삼성전자")
-        if company_name:
-            matches = corp_codes_df[corp_codes_df['corp_name'].str.contains(company_name, case=False)]
-            if not matches.empty:
-                selected = st.sidebar.selectbox(
-                    "회사 선택",
-                    matches['corp_name'].tolist(),
-                    format_func=lambda x: f"{x} ({matches[matches['corp_name']==x]['stock_code'].iloc[0]})"
-                )
-                display_korean_stock_info(matches[matches['corp_name']==selected]['corp_code'].iloc[0])
+        matches = corp_codes_df[corp_codes_df['corp_name'].str.contains(keyword, case=False, regex=False)]
+        if not matches.empty:
+            names = dict(zip(matches['stock_code'], matches['corp_name']))
+            selected = st.sidebar.selectbox(
+                "회사 선택",
+                list(names),
+                format_func=lambda x: f"{names[x]} ({x})"
+            )
+            display_korean_stock_info(corp_codes_df.loc[selected, 'corp_code'], year)
     else:
-        stock_code = st.sidebar.text_input("종목코드 입력", placeholder="예: 005930")
-        if stock_code:
-            matches = corp_codes_df[corp_codes_df['stock_code']==stock_code]
-            if not matches.empty:
-                display_korean_stock_info(matches['corp_code'].iloc[0])
+        try:
+            display_korean_stock_info(corp_codes_df.loc[keyword, 'corp_code'], year)
+        except KeyError:
+            st.warning("해당 종목코드의 회사를 찾을 수 없습니다.")
 
 def render_korean_etf_section():
     st.sidebar.subheader("한국 ETF 검색")
     etf_list = get_krx_etf_list()
     
-    search_term = st.sidebar.text_input("ETF 이름 검색", placeholder="예: KODEX 200")
-    if search_term:
-        matched_etfs = etf_list[etf_list['종목명'].str.contains(search_term, case=False)]
-        if not matched_etfs.empty:
-            selected = st.sidebar.selectbox(
-                "ETF 선택",
-                matched_etfs['종목명'].tolist(),
-                format_func=lambda x: f"{x} ({matched_etfs[matched_etfs['종목명']==x]['종목코드'].iloc[0]})"
+    # 입력값은 '조회' 버튼을 누를 때 한 번에 반영
+    with st.sidebar.form("query_form"):
+        search_term = st.text_input("ETF 이름 검색", placeholder="예: KODEX 200")
+        col1, col2 = st.columns(2)
+        with col1:
+            start_date = st.date_input(
+                "시작일",
+                value=datetime.now() - timedelta(days=365),
+                max_value=datetime.now()
+            )
+        with col2:
+            end_date = st.date_input(
+                "종료일",
+                value=datetime.now(),
+                max_value=datetime.now()
             )
-            display_korean_etf_info(matched_etfs[matched_etfs['종목명']==selected]['표준코드'].iloc[0])
+        submitted = st.form_submit_button("조회")
+    
+    query = submitted_query("kr_etf_query", submitted, (search_term, start_date, end_date))
+    if not query or not query[0]:
+        return
+    search_term, start_date, end_date = query
+    
+    matched_etfs = etf_list[etf_list['종목명'].str.contains(search_term, case=False)]
+    if not matched_etfs.empty:
+        # 종목명 -> (종목코드, 표준코드) 정확 일치 조회용 (동일 종목명은 첫 항목 사용)
+        etfs = {}
+        for name, short_code, isin in zip(
+            matched_etfs['종목명'], matched_etfs['종목코드'], matched_etfs['표준코드']
+        ):
+            etfs.setdefault(name, (short_code, isin))
+        selected = st.sidebar.selectbox(
+            "ETF 선택",
+            list(etfs),
+            format_func=lambda x: f"{x} ({etfs[x][0]})"
+        )
+        display_korean_etf_info(etfs[selected][1], start_date, end_date)
 
 def render_us_stock_section():
     st.sidebar.subheader("미국 주식 검색")
-    ticker = st.sidebar.text_input("티커 심볼 입력", placeholder="예: AAPL, MSFT")
-    if ticker:
-        period = st.sidebar.selectbox(
+    
+    # 입력값은 '조회' 버튼을 누를 때 한 번에 반영
+    with st.sidebar.form("query_form"):
+        ticker = st.text_input("티커 심볼 입력", placeholder="예: AAPL, MSFT")
+        period = st.selectbox(
             "조회 기간",
-            ['1mo', '3mo', '6mo', '1y', '2y', '5y'],
-            format_func=lambda x: {
-                '1mo': '1개월', '3mo': '3개월', '6mo': '6개월',
-                '1y': '1년', '2y': '2년', '5y': '5년'
-            }[x]
+            list(PERIOD_LABELS),
+            format_func=PERIOD_LABELS.__getitem__
         )
-        display_us_stock_info(ticker, period)
+        submitted = st.form_submit_button("조회")
+    
+    query = submitted_query("us_stock_query", submitted, (ticker, period))
+    if not query:
+        return
+    ticker, period = query
+    
+    # 중복 티커 제거 (입력 순서 유지)
+    tickers = list(dict.fromkeys(t.strip().upper() for t in ticker.split(",") if t.strip()))
+    if len(tickers) > 1:
+        display_us_stocks_info(tickers, period)
+    elif tickers:
+        display_us_stock_info(tickers[0], period)
 
 def render_us_etf_section():
     st.sidebar.subheader("미국 ETF 검색")
-    ticker = st.sidebar.text_input("티커 심볼 입력", placeholder="예: SPY, QQQ")
-    if ticker:
-        period = st.sidebar.selectbox(
+    
+    # 입력값은 '조회' 버튼을 누를 때 한 번에 반영
+    with st.sidebar.form("query_form"):
+        ticker = st.text_input("티커 심볼 입력", placeholder="예: SPY, QQQ")
+        period = st.selectbox(
             "조회 기간",
-            ['1mo', '3mo', '6mo', '1y', '2y', '5y'],
-            format_func=lambda x: {
-                '1mo': '1개월', '3mo': '3개월', '6mo': '6개월',
-                '1y': '1년', '2y': '2년', '5y': '5년'
-            }[x]
+            list(PERIOD_LABELS),
+            format_func=PERIOD_LABELS.__getitem__
         )
-        display_us_etf_info(ticker, period)
-
-def display_korean_stock_info(corp_code):
-    year = st.sidebar.slider("배당 정보 사업연도 선택", 2015, 2024, 2023)
-    report_types = {
-        "11011": "사업보고서",
-        "11012": "반기보고서",
-        "11013": "1분기보고서",
-        "11014": "3분기보고서"
-    }
-    reprt_code = st.sidebar.selectbox(
-        "보고서 종류",
-        options=list(report_types.keys()),
-        format_func=lambda x: report_types[x]
-    )
+        submitted = st.form_submit_button("조회")
     
-    data, error = get_korean_stock_dividend(corp_code, year, reprt_code)
+    query = submitted_query("us_etf_query", submitted, (ticker, period))
+    if not query or not query[0]:
+        return
+    ticker, period = query
+    display_us_etf_info(ticker, period)
+
+def display_korean_stock_info(corp_code, year):
+    results, error = get_korean_stock_dividend_all(corp_code, year)
     if error:
         st.error(error)
-    elif not data.empty:
-        st.header(f"📈 배당 정보 ({year}년 {report_types[reprt_code]})")
-        st.dataframe(data, use_container_width=True)
+        return
+    st.header(f"📈 배당 정보 ({year}년)")
+    tabs = st.tabs([REPORT_TYPES[rc] for rc in results])
+    for tab, (data, error) in zip(tabs, results.values()):
+        with tab:
+            if error:
+                st.error(error)
+            elif not data.empty:
+                st.dataframe(data, use_container_width=True)
 
-def display_korean_etf_info(etf_code):
-    col1, col2 = st.sidebar.columns(2)
-    with col1:
-        start_date = st.date_input(
-            "시작일",
-            value=datetime.now() - timedelta(days=365),
-            max_value=datetime.now()
-        )
-    with col2:
-        end_date = st.date_input(
-            "종료일",
-            value=datetime.now(),
-            max_value=datetime.now()
-        )
-    
+def display_korean_etf_info(etf_code, start_date, end_date):
     data, error = get_korean_etf_distribution(etf_code, start_date, end_date)
     if error:
         st.error(error)
@@ -320,32 +532,18 @@ def display_korean_etf_info(etf_code):
 
 def display_us_stock_info(ticker, period):
     """미국 주식 정보 디스플레이"""
-    history, info, dividends, error = get_us_stock_data(ticker, period)
+    history, dividends, error = get_us_stock_data(ticker, period)
     if error:
         st.error(error)
+    elif history.empty:
+        st.warning(f"데이터가 없는 종목: {ticker}")
     else:
-        st.header(f"📈 {info.get('shortName', ticker)} 주식 정보")
+        st.header(f"📈 {ticker} 주식 정보")
         st.subheader("주가 데이터")
-        st.dataframe(history, use_container_width=True)
+        show_history(history)
 
         # 주가 차트
-        fig = go.Figure(data=[
-            go.Candlestick(
-                x=history.index,
-                open=history['Open'],
-                high=history['High'],
-                low=history['Low'],
-                close=history['Close'],
-                name="주가"
-            )
-        ])
-        fig.update_layout(
-            title=f"{ticker} 주가 추이",
-            yaxis_title="주가",
-            xaxis_title="날짜",
-            template="plotly_white"
-        )
-        st.plotly_chart(fig)
+        plot_candlestick(history, period, f"{ticker} 주가 추이", "주가")
 
         # 배당 데이터
         if not dividends.empty:
@@ -353,34 +551,70 @@ def display_us_stock_info(ticker, period):
             st.dataframe(dividends, use_container_width=True)
             st.line_chart(dividends, use_container_width=True)
 
+def display_us_stocks_info(tickers, period):
+    """미국 주식 여러 종목 비교 디스플레이"""
+    histories, error = get_us_stocks_data(tickers, period)
+    if error:
+        st.error(error)
+        return
+    
+    missing = [t for t in tickers if t not in histories or histories[t].empty]
+    if missing:
+        st.warning(f"데이터가 없는 종목: {', '.join(missing)}")
+    tickers = [t for t in tickers if t not in missing]
+    if not tickers:
+        return
+    
+    st.header("📈 주식 비교")
+    
+    # 종목별 주가 차트
+    fig = make_subplots(
+        rows=len(tickers), cols=1,
+        subplot_titles=tickers,
+        vertical_spacing=0.3 / len(tickers)
+    )
+    for row, t in enumerate(tickers, start=1):
+        ohlc = maybe_resample(histories[t], period)
+        fig.add_trace(
+            go.Candlestick(
+                x=ohlc.index,
+                open=ohlc['Open'],
+                high=ohlc['High'],
+                low=ohlc['Low'],
+                close=ohlc['Close'],
+                name=t
+            ),
+            row=row, col=1
+        )
+        fig.update_yaxes(title_text="주가", row=row, col=1)
+        fig.update_xaxes(rangeslider_visible=False, row=row, col=1)
+    fig.update_layout(
+        height=350 * len(tickers),
+        showlegend=False,
+        template="plotly_white"
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # 종목별 주가 데이터
+    st.subheader("주가 데이터")
+    for tab, t in zip(st.tabs(tickers), tickers):
+        with tab:
+            show_history(histories[t])
+
 def display_us_etf_info(ticker, period):
     """미국 ETF 정보 디스플레이"""
-    history, info, distributions, error = get_us_etf_data(ticker, period)
+    history, distributions, error = get_us_etf_data(ticker, period)
     if error:
         st.error(error)
+    elif history.empty:
+        st.warning(f"데이터가 없는 종목: {ticker}")
     else:
-        st.header(f"📊 {info.get('shortName', ticker)} ETF 정보")
+        st.header(f"📊 {ticker} ETF 정보")
         st.subheader("주가 데이터")
-        st.dataframe(history, use_container_width=True)
+        show_history(history)
 
         # ETF 주가 차트
-        fig = go.Figure(data=[
-            go.Candlestick(
-                x=history.index,
-                open=history['Open'],
-                high=history['High'],
-                low=history['Low'],
-                close=history['Close'],
-                name="ETF 주가"
-            )
-        ])
-        fig.update_layout(
-            title=f"{ticker} ETF 주가 추이",
-            yaxis_title="주가",
-            xaxis_title="날짜",
-            template="plotly_white"
-        )
-        st.plotly_chart(fig)
+        plot_candlestick(history, period, f"{ticker} ETF 주가 추이", "ETF 주가")
 
         # 분배금 데이터
         if not distributions.empty: